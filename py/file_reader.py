@@ -1,38 +1,84 @@
-from logger import Logger
-from PyPDF2 import PdfReader
-from typing import Callable, Dict, List
-
-import docx, io, os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from operator import attrgetter
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import docx, io, logging, multiprocessing, os
+
+logger = logging.getLogger(__name__)
+
+# Prefer PyMuPDF for PDF text extraction and fall back to PyPDF2 when it is not installed
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+    from PyPDF2 import PdfReader
+
+def _init_worker_logging(log_queue: multiprocessing.Queue):
+    """
+    Forward the log records of a PDF worker process to the parent process's handlers.
+
+    Args:
+        log_queue (multiprocessing.Queue): The queue drained by the parent process's QueueListener.
+    """
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [QueueHandler(log_queue)]
+    root_logger.setLevel(logging.DEBUG)
 
 class FileReader:
-    def __init__(self, dir_paths: List[str]):
+    # Map file extensions to the names of their reader methods
+    _DISPATCH = {
+        ".docx": "_read_docx",
+        ".pdf": "_read_pdf",
+    }
+
+    # File extensions read by PyMuPDF, which is not thread-safe, so they never share the DOCX thread pool
+    _PDF_EXTENSIONS = {".pdf"}
+
+    def __init__(self, dir_paths: List[str], max_workers: Optional[int] = None, max_processes: Optional[int] = None):
         """
         Initialize a FileReader instance.
 
         Args:
             dir_paths (List[str]): A list of directory paths to search for files.
+            max_workers (Optional[int], optional): The maximum number of threads used to read DOCX files
+                (default is min(32, os.cpu_count() or 4)).
+            max_processes (Optional[int], optional): The number of processes used to read PDF files. By default
+                PDF files are read one at a time on a thread of their own, which is faster unless there are many
+                large PDF files, as every spawned process re-imports the __main__ module and its dependencies.
+                Scripts that set it must guard their entry point with if __name__ == "__main__".
         """
         self._dir_paths = dir_paths
-        self._valid_extensions = {".docx", ".pdf"}
+        self._max_workers = max_workers if max_workers is not None else min(32, os.cpu_count() or 4)
+        self._max_processes = max_processes
+        self._valid_extensions = tuple(self._DISPATCH)
 
-        # Initialize the logger
-        self._logger = Logger(__name__).get_logger()
-
-    def _retrieve_file_paths(self) -> List[str]:
+    def _retrieve_file_paths(self) -> List[Tuple[str, str]]:
         """
         Retrieve a list of file paths within the specified directories, filtered by valid extensions.
 
+        Directories that resolve to the same real path (e.g. duplicates or symlinks) are scanned only once.
+
         Returns:
-            List[str]: A list of valid file paths.
+            List[Tuple[str, str]]: A list of (file path, lowercased extension) pairs.
         """
         file_paths = []
-        
-        if self._dir_paths is not None:
+
+        if self._dir_paths:
+            # Map each real directory path to the first path given for it, preserving order
+            real_dir_paths = {}
             for dir_path in self._dir_paths:
+                real_dir_paths.setdefault(os.path.realpath(dir_path), dir_path)
+
+            for dir_path in real_dir_paths.values():
                 if os.path.isdir(dir_path):
-                    for file_name in os.listdir(dir_path):
-                        if os.path.splitext(file_name)[1].lower() in self._valid_extensions:
-                            file_paths.append(os.path.join(dir_path, file_name))
+                    with os.scandir(dir_path) as entries:
+                        for entry in entries:
+                            file_name = entry.name.lower()
+                            if file_name.endswith(self._valid_extensions) and entry.is_file():
+                                file_paths.append((entry.path, file_name[file_name.rfind("."):]))
 
         return file_paths
 
@@ -52,13 +98,13 @@ class FileReader:
             with open(file_path, "rb") as file:
                 return reader_func(file)
         except FileNotFoundError as e:
-            self._logger.error(f"File not found: {e}")
+            logger.error("File not found: %s", e)
             return f"File not found: {e}"
         except PermissionError as e:
-            self._logger.error(f"Permission error: {e}")
+            logger.error("Permission error: %s", e)
             return f"Permission error: {e}"
         except Exception as e:
-            self._logger.error(f"An error occurred: {e}")
+            logger.error("An error occurred: %s", e)
             return f"An error occurred: {e}"
 
     def _read_docx(self, file_path: str) -> str:
@@ -72,10 +118,7 @@ class FileReader:
             str: The content of the DOCX file as a string.
         """
         def read_docx_file(file: io.BytesIO) -> str:
-            text = []
-            for paragraph in docx.Document(file).paragraphs:
-                text.append(paragraph.text)
-            return '\n'.join(text)
+            return '\n'.join(map(attrgetter("text"), docx.Document(file).paragraphs))
 
         return self._read_file(file_path, read_docx_file)
 
@@ -90,37 +133,100 @@ class FileReader:
             str: The content of the PDF file as a string.
         """
         def read_pdf_file(file: io.BytesIO) -> str:
-            text = ""
-            pdf_reader = PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text()
-            return text
+            if pymupdf is not None:
+                with pymupdf.open(stream=file.read(), filetype="pdf") as document:
+                    return '\n'.join(page.get_text("text") for page in document)
+
+            text = []
+            for page in PdfReader(file).pages:
+                text.append(page.extract_text() or "")
+            return '\n'.join(text)
 
         return self._read_file(file_path, read_pdf_file)
 
+    def _dispatch_read(self, file_path: str, extension: str) -> str:
+        """
+        Read the content of a file with the reader function matching its extension.
+
+        Args:
+            file_path (str): The path to the file to be read.
+            extension (str): The lowercased extension of the file, including the leading dot.
+
+        Returns:
+            str: The content of the file as a string.
+        """
+        logger.info("Reading %s", file_path)
+        file_content = getattr(self, self._DISPATCH[extension])(file_path)
+        logger.info("Read    %s", file_path)
+
+        return file_content
+
+    @contextmanager
+    def _create_pdf_executor(self) -> Iterator[Executor]:
+        """
+        Create the executor that reads PDF files.
+
+        PDF files are read one at a time on a thread of their own, or in a pool of max_processes
+        spawned processes if it is set. Spawned rather than forked, as this process is already
+        running threads; their log records are forwarded to this process's handlers.
+
+        Yields:
+            Executor: The executor that reads PDF files.
+        """
+        if not self._max_processes:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                yield executor
+            return
+
+        context = multiprocessing.get_context("spawn")
+        log_queue = context.Queue()
+        listener = QueueListener(log_queue, *logging.getLogger().handlers, respect_handler_level=True)
+        listener.start()
+
+        try:
+            with ProcessPoolExecutor(max_workers=self._max_processes, mp_context=context, initializer=_init_worker_logging, initargs=(log_queue,)) as executor:
+                yield executor
+        finally:
+            listener.stop()
+
+    def iter_file_contents(self) -> Iterator[Tuple[str, str]]:
+        """
+        Lazily read the contents of files within specified directories.
+
+        DOCX files are read in a thread pool and PDF files by the executor from _create_pdf_executor.
+        At most max_workers + max_processes (or + 1) files are read ahead of the consumer, so only
+        a bounded number of file contents are held in memory at once.
+
+        Yields:
+            Tuple[str, str]: A (file path, file content) pair, in the order the files were found.
+        """
+        max_pending_reads = self._max_workers + (self._max_processes or 1)
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as thread_executor, self._create_pdf_executor() as pdf_executor:
+            pending_reads = deque()
+
+            for file_path, extension in self._retrieve_file_paths():
+                if len(pending_reads) >= max_pending_reads:
+                    pending_file_path, future = pending_reads.popleft()
+                    yield pending_file_path, future.result()
+
+                executor = pdf_executor if extension in self._PDF_EXTENSIONS else thread_executor
+                pending_reads.append((file_path, executor.submit(self._dispatch_read, file_path, extension)))
+
+            while pending_reads:
+                pending_file_path, future = pending_reads.popleft()
+                yield pending_file_path, future.result()
+
     def read_file_contents(self) -> Dict[str, str]:
         """
         Read the contents of files within specified directories and return them as a dictionary.
 
-        This method reads the contents of all files within the specified directories, 
-        supporting DOCX and PDF file formats, and returns them as a dictionary where 
-        keys are file paths and values are the contents of the respective files.
+        This method reads the contents of all files within the specified directories as
+        iter_file_contents does, supporting DOCX and PDF file formats, and returns them as a dictionary
+        where keys are file paths and values are the contents of the respective files.
 
         Returns:
             Dict[str, str]: A dictionary where keys are file paths and values are the
             contents of the respective files.
         """
-        # Define a dictionary to map file extensions to reader functions
-        file_extensions_and_reader_functions = {
-            ".docx": self._read_docx,
-            ".pdf": self._read_pdf,
-        }
-        
-        file_paths_and_file_contents = {}
-
-        for file_path in self._retrieve_file_paths():
-            self._logger.info(f"Reading {file_path}")
-            file_paths_and_file_contents[file_path] = file_extensions_and_reader_functions[os.path.splitext(file_path)[1].lower()](file_path)
-            self._logger.info(f"Read    {file_path}")
-
-        return file_paths_and_file_contents
+        return dict(self.iter_file_contents())
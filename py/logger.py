@@ -1,7 +1,14 @@
 from datetime import date
 from pathlib import Path
 
-import logging
+import logging, threading
+
+# Guards the one-time configuration of the root logger's handlers
+_root_lock = threading.Lock()
+_root_configured = False
+
+# Third-party loggers kept at WARNING, as their debug output would flood the log file
+_QUIET_LOGGER_NAMES = ("httpcore", "httpx", "openai", "pymongo", "urllib3")
 
 class Logger:
     def __init__(self, python_file_name: str, log_dir: str = "../log", console_level: int = logging.INFO, file_level: int = logging.DEBUG):
@@ -20,31 +27,58 @@ class Logger:
         self._file_level = file_level
         self._configure_logger()
 
-    def _configure_logger(self):
+    def _configure_root_logger(self):
         """
-        Configure the logger with console and file handlers, log levels, and formatting.
+        Attach the console and file handlers to the root logger, once per process.
+
+        The first Logger instance decides the log directory and handler levels. Modules log through
+        logging.getLogger(__name__), so their records reach these handlers once the entrypoint has
+        created a Logger; importing a module does not configure logging.
         """
-        # Create the log directory if it doesn't exist
-        Path(self._log_dir).mkdir(parents=True, exist_ok=True)
-        
-        # Define the log message format using a custom formatter.
-        formatter = logging.Formatter('%(asctime)s - %(name)-15s - %(levelname)-5s - %(message)s')
+        global _root_configured
+
+        with _root_lock:
+            if _root_configured:
+                return
+
+            # Create the log directory if it doesn't exist
+            Path(self._log_dir).mkdir(parents=True, exist_ok=True)
+
+            # Define the log message format using a custom formatter.
+            formatter = logging.Formatter('%(asctime)s - %(name)-15s - %(levelname)-5s - %(message)s')
+
+            # Create a console handler for log messages
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(self._console_level)
+            console_handler.setFormatter(formatter)
 
-        # Create a console handler for log messages
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(self._console_level)
-        console_handler.setFormatter(formatter)
+            # Create a file handler for detailed log messages
+            file_handler = logging.FileHandler(Path(self._log_dir) / (date.today().__str__() + ".log"))
+            file_handler.setLevel(self._file_level)
+            file_handler.setFormatter(formatter)
 
-        # Create a file handler for detailed log messages
-        file_handler = logging.FileHandler(Path(self._log_dir) / (date.today().__str__() + ".log"))
-        file_handler.setLevel(self._file_level)
-        file_handler.setFormatter(formatter)
+            # Add the handlers to the root logger
+            root_logger = logging.getLogger()
+            root_logger.setLevel(logging.DEBUG)  # The handlers filter by their own levels
+            root_logger.addHandler(console_handler)
+            root_logger.addHandler(file_handler)
+
+            for logger_name in _QUIET_LOGGER_NAMES:
+                logging.getLogger(logger_name).setLevel(logging.WARNING)
+
+            _root_configured = True
+
+    def _configure_logger(self):
+        """
+        Configure the logger's level and make sure the shared root handlers exist.
+
+        The logger itself has no handlers; its records propagate to the root logger.
+        """
+        self._configure_root_logger()
 
-        # Add the handlers to the logger
         logger = logging.getLogger(self._python_file_name)
         logger.setLevel(logging.DEBUG)  # You can set the global logger level here
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
+        logger.propagate = True
 
     def get_logger(self) -> logging.Logger:
         """
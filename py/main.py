@@ -1,4 +1,20 @@
+from logger import Logger
 from resume_parser import ResumeParser
 
+import argparse
+
 if __name__ == "__main__":
-    ResumeParser().parse_resumes()
+    # Configure the console and file log handlers once for every module
+    Logger(__name__)
+
+    argument_parser = argparse.ArgumentParser(description="Parse resumes with OpenAI and insert them into MongoDB.")
+    argument_parser.add_argument("--batch-api", action="store_true", help="parse through OpenAI's Batch API, which is cheaper but may take up to 24 hours")
+    argument_parser.add_argument("--batch-id", help="resume polling a Batch API batch created by an earlier run")
+    argument_parser.add_argument("--max-processes", type=int, help="read PDF files in this many processes instead of on a single thread")
+    arguments = argument_parser.parse_args()
+
+    resume_parser = ResumeParser(max_processes=arguments.max_processes)
+    if arguments.batch_api or arguments.batch_id is not None:
+        resume_parser.parse_resumes_with_batch_api_sync(batch_id=arguments.batch_id)
+    else:
+        resume_parser.parse_resumes_sync()
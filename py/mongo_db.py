@@ -1,9 +1,39 @@
-from logger import Logger
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure
 from pymongo.server_api import ServerApi
 from typing import Union, Any, Dict, List
 
+import functools, logging
+
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=8)
+def _get_client(uri: str) -> MongoClient:
+    """
+    Get a MongoDB client for the given URI, creating it on first use.
+
+    The client is cached for the lifetime of the process so that its connection pool
+    is reused across MongoDB contexts. Writes are acknowledged by the primary only,
+    which is enough for bulk inserting parsed resumes.
+
+    Args:
+        uri (str): The MongoDB connection URI.
+
+    Returns:
+        MongoClient: The cached MongoDB client.
+    """
+    return MongoClient(
+        uri,
+        server_api=ServerApi('1'),
+        serverSelectionTimeoutMS=5000,
+        maxPoolSize=50,
+        minPoolSize=5,
+        retryWrites=True,
+        w=1,
+        journal=False,
+        compressors="zstd,snappy"
+    )
+
 class MongoDB:
     def __init__(self, uri: str, database_name: str, collection_name: str):
         """
@@ -17,28 +47,27 @@ class MongoDB:
         self._uri = uri
         self._database_name = database_name
         self._collection_name = collection_name
-        self._logger = Logger(__name__).get_logger()
 
     def __enter__(self):
         """
         Enter the MongoDB context.
 
         This method is called when entering a context using the 'with' statement.
-        It establishes a connection to MongoDB and initializes database and collection objects.
+        It reuses the cached connection to MongoDB and initializes database and collection objects.
 
         Returns:
             MongoDB: The MongoDB connection object.
         """
         try:
-            self._logger.info("Connecting to MongoDB.")
-            self._client = MongoClient(self._uri, server_api=ServerApi('1'), serverSelectionTimeoutMS=5000)
+            logger.info("Connecting to MongoDB.")
+            self._client = _get_client(self._uri)
             self._database = self._client[self._database_name]
             self._collection = self._database[self._collection_name]
-            self._logger.info("Connected to MongoDB.")
+            logger.info("Connected to MongoDB.")
             return self
         except ConnectionFailure as e:
             error_message = f"Failed to connect to MongoDB: {e}"
-            self._logger.error(error_message)
+            logger.error(error_message)
             raise ConnectionFailure(error_message)
 
     def __exit__(self, exc_type, exc_value, traceback):
@@ -46,7 +75,7 @@ class MongoDB:
         Exit the MongoDB context.
 
         This method is called when exiting the context created with the 'with' statement.
-        It closes the MongoDB client connection.
+        The MongoDB client is cached and shared, so its connection pool is left open for reuse.
 
         Args:
             exc_type: The type of exception that occurred (if any).
@@ -54,9 +83,7 @@ class MongoDB:
             traceback: The traceback object (if any).
         """
         if self._client is not None:
-            self._logger.info("Disconnecting from MongoDB.")
-            self._client.close()
-            self._logger.info("Disconnected from MongoDB.")
+            logger.info("Released the MongoDB connection.")
 
     def insert_data(self, data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Union[str, List[str]]:
         """
@@ -70,18 +97,19 @@ class MongoDB:
         """ 
         try:
             if isinstance(data, dict):
-                self._logger.info("Inserting data.")
+                logger.info("Inserting data.")
                 result = self._collection.insert_one(data)
-                self._logger.info("Inserted  data.")
+                logger.info("Inserted  data.")
                 return str(result.inserted_id)
             elif isinstance(data, list):
-                self._logger.info("Inserting a list of data.")
-                result = self._collection.insert_many(data)
-                self._logger.info("Inserted  a list of data.")
+                logger.info("Inserting a list of data.")
+                # Unordered inserts let the server continue past a failing document
+                result = self._collection.insert_many(data, ordered=False)
+                logger.info("Inserted  a list of data.")
                 return [str(document_id) for document_id in result.inserted_ids]
             else:
                 raise ValueError("Invalid data type. It should be a dictionary or a list of dictionaries.")
         except Exception as e:
             error_message = f"Failed to insert data into MongoDB: {e}"
-            self._logger.error(error_message)
+            logger.error(error_message)
             raise Exception(error_message)
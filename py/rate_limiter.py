@@ -0,0 +1,57 @@
+import asyncio, logging, time
+
+logger = logging.getLogger(__name__)
+
+class RateLimiter:
+    def __init__(self, max_requests_per_minute: float, max_tokens_per_minute: float):
+        """
+        Initialize a RateLimiter instance.
+
+        The limiter keeps a request budget and a token budget that refill continuously
+        up to their per-minute limits, following OpenAI's parallel request processor recipe.
+
+        Args:
+            max_requests_per_minute (float): The maximum number of requests allowed per minute.
+            max_tokens_per_minute (float): The maximum number of tokens allowed per minute.
+        """
+        self._max_requests_per_minute = max_requests_per_minute
+        self._max_tokens_per_minute = max_tokens_per_minute
+        self._available_request_capacity = max_requests_per_minute
+        self._available_token_capacity = max_tokens_per_minute
+        self._last_update_time = time.monotonic()
+
+    def _refill(self):
+        """
+        Refill the request and token capacities in proportion to the time elapsed since the last update.
+        """
+        current_time = time.monotonic()
+        elapsed_minutes = (current_time - self._last_update_time) / 60
+        self._last_update_time = current_time
+
+        self._available_request_capacity = min(self._available_request_capacity + self._max_requests_per_minute * elapsed_minutes, self._max_requests_per_minute)
+        self._available_token_capacity = min(self._available_token_capacity + self._max_tokens_per_minute * elapsed_minutes, self._max_tokens_per_minute)
+
+    async def acquire(self, token_count: int):
+        """
+        Wait until one request and the given number of tokens are available, then consume them.
+
+        Args:
+            token_count (int): The estimated number of tokens the request will use. Counts above
+                the per-minute token limit are capped to it so the request can still proceed.
+        """
+        token_count = min(token_count, self._max_tokens_per_minute)
+
+        while True:
+            self._refill()
+
+            if self._available_request_capacity >= 1 and self._available_token_capacity >= token_count:
+                self._available_request_capacity -= 1
+                self._available_token_capacity -= token_count
+                return
+
+            # Sleep until the scarcer of the two capacities has refilled enough
+            request_wait = (1 - self._available_request_capacity) / self._max_requests_per_minute * 60
+            token_wait = (token_count - self._available_token_capacity) / self._max_tokens_per_minute * 60
+            wait_seconds = max(request_wait, token_wait, 0.001)
+            logger.debug("Rate limit reached, waiting %.2f seconds", wait_seconds)
+            await asyncio.sleep(wait_seconds)
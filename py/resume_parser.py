@@ -1,32 +1,112 @@
 from file_reader import FileReader
 from jsoner import JSONer
-from logger import Logger
 from mongo_db import MongoDB
+from openai import AsyncOpenAI
 from pathlib import Path
-from typing import Dict
+from rate_limiter import RateLimiter
+from tenacity import before_sleep_log, retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-import json, openai, os
+import asyncio, fastjsonschema, functools, hashlib, logging, openai, orjson, os
+
+logger = logging.getLogger(__name__)
+
+# Use tiktoken to estimate request sizes when it is installed
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Retry transient OpenAI errors with randomized exponential backoff
+_retry_openai_request = retry(
+    retry=retry_if_exception_type((openai.RateLimitError, openai.APIConnectionError, openai.APITimeoutError, openai.InternalServerError)),
+    wait=wait_random_exponential(min=1, max=60),
+    stop=stop_after_attempt(6),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
 
 class ResumeParser:
-    def __init__(self):
+    def __init__(self, model: str = "gpt-4o-mini", max_tokens: int = 4096, max_concurrent: int = 8, max_requests_per_minute: int = 3500, max_tokens_per_minute: int = 90000, resumes_per_request: int = 1, max_batch_tokens: int = 12000, max_output_tokens: int = 16384, max_workers: Optional[int] = None, max_processes: Optional[int] = None):
         """
         Initialize a ResumeParser instance.
 
-        This class is designed to parse resume documents using OpenAI's GPT-3 language model.
+        This class is designed to parse resume documents using an OpenAI chat model in JSON mode.
+
+        Args:
+            model (str, optional): The OpenAI chat model used for parsing (default is "gpt-4o-mini").
+            max_tokens (int, optional): The maximum number of tokens generated per resume (default is 4096).
+            max_concurrent (int, optional): The maximum number of concurrent OpenAI requests (default is 8).
+            max_requests_per_minute (int, optional): The OpenAI request rate limit (default is 3500).
+            max_tokens_per_minute (int, optional): The OpenAI token rate limit (default is 90000).
+            resumes_per_request (int, optional): The maximum number of resumes packed into one OpenAI request (default is 1).
+            max_batch_tokens (int, optional): The maximum number of resume content tokens packed into one OpenAI request (default is 12000).
+            max_output_tokens (int, optional): The model's output token limit, which caps max_tokens of multi-resume requests (default is 16384, as for gpt-4o-mini).
+            max_workers (Optional[int], optional): The maximum number of threads used to read DOCX files (default is FileReader's).
+            max_processes (Optional[int], optional): The number of processes used to read PDF files (default is None, reading them
+                on a thread of their own). Scripts that set it must guard their entry point with if __name__ == "__main__".
 
         Attributes:
             _json_dir_path (str): The directory path where JSON files are stored.
-            _logger (logging.Logger): The logger instance for logging messages.
+            _parsed_resume_dir_path (Path): The directory path where parsed resume JSON files are stored.
         """
         self._json_dir_path = "../json/"
+        self._parsed_resume_dir_path = Path(self._json_dir_path, "parsed_resume")
+        self._parsing_format_path = os.path.join(self._json_dir_path, "configuration/parsing_format.json")
+        self._model = model
+        self._max_tokens = max_tokens
+        self._max_concurrent = max_concurrent
+        self._resumes_per_request = resumes_per_request
+        self._max_batch_tokens = max_batch_tokens
+        self._max_output_tokens = max_output_tokens
+        self._max_workers = max_workers
+        self._max_processes = max_processes
+        self._rate_limiter = RateLimiter(max_requests_per_minute, max_tokens_per_minute)
         self._jsoner = JSONer()
-        self._logger = Logger(__name__).get_logger()
+        self._encoding = self._get_encoding()
 
         self._set_openai_api_key()
 
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _load_json_cached(json_path: str) -> str:
+        """
+        Load a JSON configuration file as compact JSON text, once per path and process.
+
+        Args:
+            json_path (str): The path to the JSON file.
+
+        Returns:
+            str: The JSON content serialized without whitespace.
+
+        Raises:
+            FileNotFoundError: If the JSON file is not found.
+        """
+        return orjson.dumps(orjson.loads(Path(json_path).read_bytes())).decode()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _compile_validator(parsing_format: str) -> Callable:
+        """
+        Compile a JSON schema validator for the parsing format, once per parsing format and process.
+
+        The "date" format is not enforced, since resumes give dates and date ranges in free form,
+        and the "email" format also accepts an empty string, since not every resume gives an address.
+
+        Args:
+            parsing_format (str): The parsing format provided in JSON.
+
+        Returns:
+            Callable: A validator raising fastjsonschema.JsonSchemaException on invalid data.
+        """
+        return fastjsonschema.compile(orjson.loads(parsing_format), formats={
+            "date": lambda value: True,
+            "email": r"^(|(?!.*\.\..*@)[^@.][^@]*(?<!\.)@[^@]+\.[^@]+)\Z"
+        })
+
     def _set_openai_api_key(self):
         """
-        Set the OpenAI API key from a JSON file.
+        Set the OpenAI API key from a JSON file and create the asynchronous OpenAI client.
 
         If the API key file is not found, raise a FileNotFoundError and log an error message.
 
@@ -35,59 +115,501 @@ class ResumeParser:
         """
         api_key_path = os.path.join(self._json_dir_path, "configuration/api_key.json")
         try:
-            openai.api_key = self._jsoner.read_json(api_key_path).get("api_key")
+            # Retries are handled by _retry_openai_request, so the client's own retries are disabled
+            self._client = AsyncOpenAI(api_key=orjson.loads(self._load_json_cached(api_key_path)).get("api_key"), max_retries=0)
         except FileNotFoundError as e:
             error_message = f"Failed to set API key: API key file not found at {api_key_path}. Please provide a valid API key. {e}"
-            self._logger.error(error_message)
+            logger.error(error_message)
             raise FileNotFoundError(error_message)        
             
-    def _parse_resume_with_openai(self, owner: str, resume_content: str, parsing_format: str) -> Dict:
+    def _get_encoding(self):
+        """
+        Get the tiktoken encoding for the model.
+
+        Returns:
+            Optional[tiktoken.Encoding]: The encoding, or None if tiktoken is not installed
+            or its encoding files cannot be loaded.
+        """
+        if tiktoken is None:
+            return None
+
+        try:
+            try:
+                return tiktoken.encoding_for_model(self._model)
+            except KeyError:
+                return tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            # tiktoken downloads its encoding files on first use, which fails when offline
+            logger.warning("Failed to load the tiktoken encoding, estimating tokens from characters: %s", e)
+            return None
+
+    def _count_tokens(self, text: str) -> int:
         """
-        Parse a resume using OpenAI's GPT-3 language model.
+        Estimate the number of tokens in a text.
+
+        Falls back to roughly four characters per token when tiktoken is not installed.
+
+        Args:
+            text (str): The text to be measured.
+
+        Returns:
+            int: The estimated number of tokens.
+        """
+        if self._encoding is None:
+            return len(text) // 4 + 1
+
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+    @staticmethod
+    def _build_resume_message(owner: str, resume_content: str) -> str:
+        """
+        Build the user message that asks to parse a single resume.
 
         Args:
             owner (str): The owner's name of the resume.
             resume_content (str): The content of the resume.
-            parsing_format (str): The parsing format provided in JSON.
 
         Returns:
-            Dict: The parsed resume content as a dictionary.
+            str: The user message.
         """
-        return openai.ChatCompletion.create(
-            temperature=1,
-            model="gpt-3.5-turbo-16k",
-            messages=[
+        return "Owner: " + owner + "\n\n" + resume_content
+
+    def _build_chat_completion_body(self, user_message: str, system_prompt: str, max_tokens: Optional[int] = None) -> Dict:
+        """
+        Build a chat completion request body in JSON mode, with the shared system prompt first.
+
+        Args:
+            user_message (str): The user message of the request.
+            system_prompt (str): The system prompt containing the parsing format provided in JSON.
+            max_tokens (Optional[int], optional): The maximum number of generated tokens (default is max_tokens).
+
+        Returns:
+            Dict: The keyword arguments of the chat completion request.
+        """
+        return {
+            "temperature": 0,
+            "model": self._model,
+            "max_tokens": max_tokens if max_tokens is not None else self._max_tokens,
+            "response_format": {"type": "json_object"},
+            "messages": [
+                {
+                    "role": "system",
+                    "content": system_prompt
+                },
                 {
                     "role": "user",
-                    "content": f"Parse {owner}'s resume by using the JSON format below.\n\n{resume_content}\n\n{parsing_format}"
+                    "content": user_message
                 }
             ]
-        )
+        }
 
-    def parse_resumes(self):
+    async def _stream_chat_completion(self, body: Dict) -> Tuple[str, str]:
         """
-        Parse resumes using OpenAI's GPT-3 language model, store the parsed results as JSON files,
-        and insert the parsed data into MongoDB.
+        Send a chat completion request with streaming and collect the generated message.
+
+        Streaming keeps the connection active while long JSON outputs are generated, instead of
+        waiting silently for the whole completion.
+
+        Args:
+            body (Dict): The keyword arguments of the chat completion request.
+
+        Returns:
+            Tuple[str, str]: The generated message content and the finish reason.
         """
-        parsed_contents = []
+        content_parts = []
+        finish_reason = None
 
-        # Load the parsing format from a JSON file
-        parsing_format = json.dumps(self._jsoner.read_json(os.path.join(self._json_dir_path, "configuration/parsing_format.json")), indent=4)
+        async for chunk in await self._client.chat.completions.create(**body, stream=True):
+            if not chunk.choices:
+                continue
+
+            choice = chunk.choices[0]
+            if choice.delta.content:
+                content_parts.append(choice.delta.content)
+            if choice.finish_reason is not None:
+                finish_reason = choice.finish_reason
+
+        return "".join(content_parts), finish_reason
+
+    @_retry_openai_request
+    async def _parse_resume_with_openai(self, owner: str, resume_content: str, system_prompt: str) -> Tuple[str, str]:
+        """
+        Parse a resume using an OpenAI chat model in JSON mode.
+
+        The system prompt carrying the parsing format is identical across calls, so it is sent
+        as the first message where OpenAI can cache it as a shared prompt prefix. Transient
+        OpenAI errors are retried up to six attempts with randomized exponential backoff.
+
+        Args:
+            owner (str): The owner's name of the resume.
+            resume_content (str): The content of the resume.
+            system_prompt (str): The system prompt containing the parsing format provided in JSON.
+
+        Returns:
+            Tuple[str, str]: The generated JSON content and the finish reason.
+        """
+        # Wait for enough request and token capacity before sending
+        await self._rate_limiter.acquire(self._count_tokens(system_prompt) + self._count_tokens(resume_content) + self._max_tokens)
+
+        return await self._stream_chat_completion(self._build_chat_completion_body(self._build_resume_message(owner, resume_content), system_prompt))
+
+    @_retry_openai_request
+    async def _parse_resume_batch(self, batch: List[Tuple[str, str]], system_prompt: str) -> Tuple[str, str]:
+        """
+        Parse several resumes in a single request using an OpenAI chat model in JSON mode.
+
+        The model is asked to return one JSON object keyed by the owners' names, whose values
+        follow the parsing format. Transient OpenAI errors are retried like single-resume requests.
+
+        Args:
+            batch (List[Tuple[str, str]]): A list of (owner, resume content) pairs with distinct owners.
+            system_prompt (str): The system prompt containing the parsing format provided in JSON.
+
+        Returns:
+            Tuple[str, str]: The generated JSON content and the finish reason.
+        """
+        # Asking for more than the model's output limit is rejected, so a truncated reply is preferable
+        max_tokens = min(self._max_tokens * len(batch), self._max_output_tokens)
+
+        # Wait for enough request and token capacity before sending
+        await self._rate_limiter.acquire(self._count_tokens(system_prompt) + sum(self._count_tokens(resume_content) for _, resume_content in batch) + max_tokens)
 
-        # Read resume files and their contents
-        file_paths_and_file_contents = FileReader(["../docx", "../pdf"]).read_file_contents()
+        sections = [f"Resume {index} (owner: {owner}):\n\n{resume_content}" for index, (owner, resume_content) in enumerate(batch, start=1)]
 
-        if file_paths_and_file_contents is not None:
-            for file_path, file_content in file_paths_and_file_contents.items():
-                self._logger.info(f"Parsing {file_path}")
+        return await self._stream_chat_completion(self._build_chat_completion_body(
+            "Parse the following resumes. Return a JSON object where each key is the owner's name and each value is that resume parsed to the JSON schema.\n\n" + "\n\n".join(sections),
+            system_prompt,
+            max_tokens
+        ))
 
-                # Parse the resume content using OpenAI
-                response = self._parse_resume_with_openai(Path(file_path).stem, file_content, parsing_format)
-                parsed_contents.append(json.loads(response["choices"][0]["message"]["content"]))
+    def _iter_batches(self, file_paths_and_file_contents: Iterable[Tuple[str, str]]) -> Iterator[List[Tuple[str, str]]]:
+        """
+        Group resumes into batches that are each sent to OpenAI in a single request.
+
+        A batch holds at most resumes_per_request resumes and max_batch_tokens tokens of resume content,
+        and never two resumes with the same owner. A resume larger than max_batch_tokens gets a batch of its own.
+
+        Args:
+            file_paths_and_file_contents (Iterable[Tuple[str, str]]): The (file path, resume content) pairs.
+
+        Yields:
+            List[Tuple[str, str]]: A batch of (file path, resume content) pairs.
+        """
+        batch, batch_owners, batch_tokens = [], set(), 0
+
+        for file_path, file_content in file_paths_and_file_contents:
+            owner = Path(file_path).stem
+            token_count = self._count_tokens(file_content) if self._resumes_per_request > 1 else 0
+
+            if batch and (batch_tokens + token_count > self._max_batch_tokens or owner in batch_owners):
+                yield batch
+                batch, batch_owners, batch_tokens = [], set(), 0
 
-                # Write the parsed content to a JSON file
-                self._jsoner.write_json(os.path.join(self._json_dir_path, "parsed_resume", Path(file_path).stem + ".json"), response["choices"][0]["message"]["content"])
-                self._logger.info(f"Parsed  {file_path}, Finish Reason: {response['choices'][0]['finish_reason']}")
+            batch.append((file_path, file_content))
+            batch_owners.add(owner)
+            batch_tokens += token_count
+
+            # Hand a full batch over right away rather than after the next file is read
+            if len(batch) >= self._resumes_per_request:
+                yield batch
+                batch, batch_owners, batch_tokens = [], set(), 0
+
+        if batch:
+            yield batch
+
+    def _iter_uncached_resumes(self, file_paths_and_file_contents: Iterable[Tuple[str, str]], system_prompt: str, cache: Dict[str, str], file_paths_and_cache_keys: Dict[str, str]) -> Iterator[Tuple[str, str]]:
+        """
+        Filter out resumes whose parsed JSON file is still up to date.
+
+        Args:
+            file_paths_and_file_contents (Iterable[Tuple[str, str]]): The (file path, resume content) pairs.
+            system_prompt (str): The system prompt containing the parsing format provided in JSON.
+            cache (Dict[str, str]): The cache mapping resume stems to the key of their last successful parse.
+            file_paths_and_cache_keys (Dict[str, str]): A dictionary filled with the cache key of each yielded resume.
+
+        Yields:
+            Tuple[str, str]: A (file path, resume content) pair that needs to be parsed.
+        """
+        for file_path, file_content in file_paths_and_file_contents:
+            owner = Path(file_path).stem
+            cache_key = self._get_cache_key(file_content, system_prompt)
+            if cache.get(owner) == cache_key and (self._parsed_resume_dir_path / f"{owner}.json").is_file():
+                logger.info("Cache hit for %s", file_path)
+            else:
+                file_paths_and_cache_keys[file_path] = cache_key
+                yield file_path, file_content
+
+    @_retry_openai_request
+    async def _repair_parsed_resume(self, content: str, error_message: str, system_prompt: str) -> Tuple[str, str]:
+        """
+        Ask the model to fix parsed resume JSON that does not match the parsing format.
+
+        This is much cheaper than parsing the resume again, as only the faulty JSON is sent.
+
+        Args:
+            content (str): The parsed resume JSON that failed validation.
+            error_message (str): The validation error.
+            system_prompt (str): The system prompt containing the parsing format provided in JSON.
+
+        Returns:
+            Tuple[str, str]: The repaired JSON content and the finish reason.
+        """
+        user_message = f"Fix this JSON to match the schema. Error: {error_message}. JSON: {content}"
+
+        # Wait for enough request and token capacity before sending
+        await self._rate_limiter.acquire(self._count_tokens(system_prompt) + self._count_tokens(user_message) + self._max_tokens)
+
+        return await self._stream_chat_completion(self._build_chat_completion_body(user_message, system_prompt))
+
+    async def _validate_parsed_resume(self, parsed_content: Dict, system_prompt: str) -> Dict:
+        """
+        Validate a parsed resume against the parsing format, repairing it once if it does not match.
+
+        A repair cannot make up data the resume does not have, so a resume that still does not match
+        afterwards, or whose repair fails, is kept as it is with a warning rather than lost.
+
+        Args:
+            parsed_content (Dict): The parsed resume content.
+            system_prompt (str): The system prompt containing the parsing format provided in JSON.
+
+        Returns:
+            Dict: The valid parsed resume content, or the best content available if it cannot be made valid.
+        """
+        validator = self._compile_validator(self._load_json_cached(self._parsing_format_path))
+
+        try:
+            return validator(parsed_content)
+        except fastjsonschema.JsonSchemaException as e:
+            logger.warning("Repairing parsed resume that does not match the parsing format: %s", e.message)
+            error_message = e.message
+
+        try:
+            content, _ = await self._repair_parsed_resume(orjson.dumps(parsed_content).decode(), error_message, system_prompt)
+            repaired_content = orjson.loads(content)
+            if not isinstance(repaired_content, dict):
+                raise ValueError("the repaired content is not a JSON object")
+        except Exception as e:
+            logger.warning("Keeping parsed resume that does not match the parsing format, as its repair failed: %s", e)
+            return parsed_content
+
+        try:
+            return validator(repaired_content)
+        except fastjsonschema.JsonSchemaException as e:
+            logger.warning("Keeping repaired resume that still does not match the parsing format: %s", e.message)
+            return repaired_content
+
+    def _iter_unique_resumes(self, file_paths_and_file_contents: Iterable[Tuple[str, str]], file_paths_and_cache_keys: Dict[str, str], duplicate_file_paths: Dict[str, List[str]]) -> Iterator[Tuple[str, str]]:
+        """
+        Filter out resumes whose content is identical to a resume seen earlier in this run.
+
+        Identical contents have identical cache keys, so the keys double as content hashes.
+
+        Args:
+            file_paths_and_file_contents (Iterable[Tuple[str, str]]): The (file path, resume content) pairs.
+            file_paths_and_cache_keys (Dict[str, str]): A dictionary holding the cache key of each resume.
+            duplicate_file_paths (Dict[str, List[str]]): A dictionary filled with the file paths of the duplicates
+                of each yielded resume, keyed by the yielded file path.
+
+        Yields:
+            Tuple[str, str]: A (file path, resume content) pair whose content has not been seen yet.
+        """
+        cache_keys_and_file_paths = {}
+
+        for file_path, file_content in file_paths_and_file_contents:
+            first_file_path = cache_keys_and_file_paths.setdefault(file_paths_and_cache_keys[file_path], file_path)
+            if first_file_path == file_path:
+                yield file_path, file_content
+            else:
+                logger.info("Skipping %s, identical to %s", file_path, first_file_path)
+                duplicate_file_paths.setdefault(first_file_path, []).append(file_path)
+
+    async def _save_duplicate_resumes(self, file_path: str, parsed_content: Dict, duplicate_file_paths: Dict[str, List[str]]) -> List[Tuple[str, bool]]:
+        """
+        Write the parsed content of a resume to the JSON files of its duplicates.
+
+        Args:
+            file_path (str): The path to the parsed resume file.
+            parsed_content (Dict): The parsed resume content.
+            duplicate_file_paths (Dict[str, List[str]]): The file paths of the duplicates of each parsed resume.
+
+        Returns:
+            List[Tuple[str, bool]]: The file path of each duplicate of the resume and whether its JSON file was written.
+        """
+        same_file_paths = duplicate_file_paths.get(file_path, [])
+
+        written = await asyncio.gather(*[
+            asyncio.to_thread(self._jsoner.write_json, self._parsed_resume_dir_path / f"{Path(same_file_path).stem}.json", parsed_content)
+            for same_file_path in same_file_paths
+        ])
+
+        return list(zip(same_file_paths, written))
+
+    def _get_cache_key(self, resume_content: str, system_prompt: str) -> str:
+        """
+        Compute the cache key of a resume parse.
+
+        The key changes whenever the model, the system prompt or the resume content changes.
+
+        Args:
+            resume_content (str): The content of the resume.
+            system_prompt (str): The system prompt containing the parsing format provided in JSON.
+
+        Returns:
+            str: The SHA-256 hex digest identifying the parse.
+        """
+        return hashlib.sha256((self._model + system_prompt + resume_content).encode("utf-8")).hexdigest()
+
+    async def _parse_single_resume(self, owner: str, resume_content: str, system_prompt: str) -> Tuple[Dict, str]:
+        """
+        Parse a single resume with OpenAI and validate the parsed content.
+
+        Args:
+            owner (str): The owner's name of the resume.
+            resume_content (str): The content of the resume.
+            system_prompt (str): The system prompt containing the parsing format provided in JSON.
+
+        Returns:
+            Tuple[Dict, str]: The valid parsed resume content and the finish reason.
+        """
+        content, finish_reason = await self._parse_resume_with_openai(owner, resume_content, system_prompt)
+
+        return await self._validate_parsed_resume(orjson.loads(content), system_prompt), finish_reason
+
+    async def _parse_and_save_resumes(self, batch: List[Tuple[str, str]], system_prompt: str) -> List[Union[Tuple[Dict, bool], Exception]]:
+        """
+        Parse a batch of resumes with OpenAI and write each valid parsed content to a JSON file.
+
+        A batch of one resume is sent as a single-resume request. Resumes missing from the response
+        to a multi-resume request, e.g. because the model keyed them by another name, are sent again
+        as single-resume requests, as are all of them if the response is cut off or is not valid JSON.
+        Each resume is validated on its own, so a resume that is still invalid after its repair fails
+        without taking the rest of the batch with it.
+
+        Args:
+            batch (List[Tuple[str, str]]): A list of (file path, resume content) pairs.
+            system_prompt (str): The system prompt containing the parsing format provided in JSON.
+
+        Returns:
+            List[Union[Tuple[Dict, bool], Exception]]: Each parsed resume content as a dictionary with whether
+            its JSON file was written, or the exception that made the resume fail, in the order of the batch.
+        """
+        owners = [Path(file_path).stem for file_path, _ in batch]
+
+        for file_path, _ in batch:
+            logger.info("Parsing %s", file_path)
+
+        # Parse the resume contents using OpenAI, sending a batch of one resume as a single-resume request
+        parsed_batch, finish_reason = {}, None
+        if len(batch) > 1:
+            content, finish_reason = await self._parse_resume_batch([(owner, file_content) for owner, (_, file_content) in zip(owners, batch)], system_prompt)
+            try:
+                if finish_reason == "length":
+                    raise ValueError("the response was cut off at max_tokens")
+                parsed_batch = orjson.loads(content)
+            except ValueError as e:
+                logger.warning("Failed to decode the batch response, parsing its resumes on their own: %s", e)
+            if not isinstance(parsed_batch, dict):
+                parsed_batch = {}
+
+        # Validate the resumes one at a time, so this consumer keeps a single request in flight
+        results = []
+        for owner, (file_path, file_content) in zip(owners, batch):
+            try:
+                if isinstance(parsed_batch.get(owner), dict):
+                    results.append((await self._validate_parsed_resume(parsed_batch[owner], system_prompt), finish_reason))
+                    continue
+
+                # Send the resumes the model did not key by their owner again on their own
+                if len(batch) > 1:
+                    logger.warning("%s is missing from the batch response, parsing it on its own", file_path)
+                results.append(await self._parse_single_resume(owner, file_content, system_prompt))
+            except Exception as e:
+                results.append(e)
+
+        # Write the valid parsed contents to JSON files concurrently in worker threads so other requests keep progressing
+        written = iter(await asyncio.gather(*[
+            asyncio.to_thread(self._jsoner.write_json, self._parsed_resume_dir_path / f"{owner}.json", result[0])
+            for owner, result in zip(owners, results)
+            if not isinstance(result, Exception)
+        ]))
+
+        for (file_path, _), result in zip(batch, results):
+            if not isinstance(result, Exception):
+                logger.info("Parsed  %s, Finish Reason: %s", file_path, result[1])
+
+        return [result if isinstance(result, Exception) else (result[0], next(written)) for result in results]
+
+    async def _produce_batches(self, batches: Iterator[List[Tuple[str, str]]], queue: asyncio.Queue, consumer_count: int):
+        """
+        Put batches of resumes on the queue as they are read, then signal the end to every consumer.
+
+        The batches are pulled in a worker thread, so reading files does not block the event loop,
+        and the bounded queue stops reading ahead while all consumers are busy. If reading fails,
+        the error is logged and the batches already queued are still parsed, saved and inserted.
+
+        Args:
+            batches (Iterator[List[Tuple[str, str]]]): The batches of (file path, resume content) pairs.
+            queue (asyncio.Queue): The bounded queue shared with the consumers.
+            consumer_count (int): The number of consumers waiting on the queue.
+        """
+        try:
+            while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+                await queue.put(batch)
+        except Exception as e:
+            logger.error("Failed to read resumes, parsing only those already read: %s", e)
+        finally:
+            for _ in range(consumer_count):
+                await queue.put(None)
+
+    async def _consume_batches(self, queue: asyncio.Queue, system_prompt: str) -> List[Tuple[List[str], Union[List[Union[Tuple[Dict, bool], Exception]], Exception]]]:
+        """
+        Parse batches of resumes taken from the queue until the producer signals the end.
+
+        Args:
+            queue (asyncio.Queue): The bounded queue shared with the producer.
+            system_prompt (str): The system prompt containing the parsing format provided in JSON.
+
+        Returns:
+            List[Tuple[List[str], Union[List[Union[Tuple[Dict, bool], Exception]], Exception]]]: The file paths of
+            each consumed batch paired with the parse result of each of its resumes, or with the exception that made
+            it fail. Resume contents are not kept, so they can be freed once their batch is parsed.
+        """
+        results = []
+
+        while (batch := await queue.get()) is not None:
+            file_paths = [file_path for file_path, _ in batch]
+            try:
+                results.append((file_paths, await self._parse_and_save_resumes(batch, system_prompt)))
+            except Exception as e:
+                results.append((file_paths, e))
+
+        return results
+
+    def _build_system_prompt(self) -> str:
+        """
+        Build the system prompt shared by every request, carrying the parsing format.
+
+        The prompt is byte-identical across requests and always sent first, so OpenAI's automatic
+        prompt caching can reuse it; per-resume text only goes into the user message.
+
+        Returns:
+            str: The system prompt containing the parsing format provided in JSON.
+        """
+        # Load the parsing format from a JSON file
+        parsing_format = self._load_json_cached(self._parsing_format_path)
+
+        return f"You output only valid JSON matching the provided schema. Parse resumes to this JSON schema:\n{parsing_format}"
+
+    def _insert_into_mongo_db(self, parsed_contents: List[Dict]):
+        """
+        Insert parsed resume contents into MongoDB.
+
+        Args:
+            parsed_contents (List[Dict]): The parsed resume contents to be inserted.
+        """
+        if not parsed_contents:
+            logger.info("No parsed resumes to insert into MongoDB.")
+            return
 
         # Retrieve the DB configuration information
         db_config = self._jsoner.read_json("../json/configuration/mongo_db.json")
@@ -96,3 +618,187 @@ class ResumeParser:
         with MongoDB(db_config.get("uri"), db_config.get("database_name"), db_config.get("collection_name")) as mongo_db:
             # Insert the parsed resume data into MongoDB
             mongo_db.insert_data(parsed_contents)
+
+    async def parse_resumes(self):
+        """
+        Parse resumes using an OpenAI chat model, store the parsed results as JSON files,
+        and insert the parsed data into MongoDB.
+
+        Resumes are streamed from disk and sent to OpenAI concurrently, keeping at most max_concurrent
+        requests in flight and only a bounded number of resume contents in memory.
+        A resume that fails to parse is logged and left out of the MongoDB insert. A resume whose
+        content, model and parsing format are unchanged since the run that wrote its JSON file is
+        skipped, as it was parsed and inserted by that run; the cache is only written after a
+        successful insert. Resumes with identical contents are parsed once and the result is
+        saved for each of them.
+        """
+        parsed_contents = []
+
+        # Build the system prompt once so every request shares the same prefix
+        system_prompt = self._build_system_prompt()
+
+        # Create the parsed resume directory, which a fresh checkout does not have
+        self._parsed_resume_dir_path.mkdir(parents=True, exist_ok=True)
+
+        # Load the cache mapping resume stems to the key of their last successful parse
+        cache_path = self._parsed_resume_dir_path / ".cache.json"
+        cache = (self._jsoner.read_json(cache_path) if cache_path.is_file() else None) or {}
+
+        # Lazily read resume files, skip the cached and duplicated ones and group the rest into batches
+        file_paths_and_cache_keys, duplicate_file_paths = {}, {}
+        batches = self._iter_batches(self._iter_unique_resumes(self._iter_uncached_resumes(FileReader(["../docx", "../pdf"], max_workers=self._max_workers, max_processes=self._max_processes).iter_file_contents(), system_prompt, cache, file_paths_and_cache_keys), file_paths_and_cache_keys, duplicate_file_paths))
+
+        # Parse the batches of resumes concurrently using OpenAI while the remaining files are read
+        queue = asyncio.Queue(maxsize=self._max_concurrent)
+        _, *consumer_results = await asyncio.gather(
+            self._produce_batches(batches, queue, self._max_concurrent),
+            *[self._consume_batches(queue, system_prompt) for _ in range(self._max_concurrent)]
+        )
+
+        for file_paths, result in (batch_result for results in consumer_results for batch_result in results):
+            # A failed request fails every resume of its batch
+            if isinstance(result, Exception):
+                result = [result] * len(file_paths)
+
+            for file_path, resume_result in zip(file_paths, result):
+                if isinstance(resume_result, Exception):
+                    logger.error("Failed to parse %s: %s", file_path, resume_result)
+                    continue
+
+                parsed_content, written = resume_result
+                for same_file_path, same_written in [(file_path, written), *await self._save_duplicate_resumes(file_path, parsed_content, duplicate_file_paths)]:
+                    # Copy the content so that each MongoDB document gets its own _id
+                    parsed_contents.append(dict(parsed_content))
+
+                    # A cache hit relies on the JSON file, so only cache resumes whose file was written
+                    if same_written:
+                        cache[Path(same_file_path).stem] = file_paths_and_cache_keys[same_file_path]
+
+        self._insert_into_mongo_db(parsed_contents)
+
+        # Record the parses only once they are in MongoDB, so a failed insert is retried by the next run
+        if parsed_contents:
+            self._jsoner.write_json(cache_path, cache)
+
+    async def parse_resumes_with_batch_api(self, poll_interval: float = 60, batch_id: Optional[str] = None):
+        """
+        Parse resumes through OpenAI's Batch API, store the parsed results as JSON files,
+        and insert the parsed data into MongoDB.
+
+        This is meant for non-interactive runs: the Batch API is cheaper and has no request rate
+        pressure, but may take up to 24 hours. All resumes that need parsing are uploaded as one
+        JSONL file of chat completion requests, the batch is polled until it ends, and its results
+        are written back per resume. Cached and duplicated resumes are handled as in parse_resumes.
+        Transient OpenAI errors are retried like chat completion requests. A run that still fails
+        after the batch was created can be resumed by passing the logged batch ID, which polls that
+        batch instead of submitting a new one.
+
+        Args:
+            poll_interval (float, optional): The number of seconds between batch status checks (default is 60).
+            batch_id (Optional[str], optional): The ID of a previously created batch to resume (default is None).
+        """
+        parsed_contents = []
+        system_prompt = self._build_system_prompt()
+
+        # Create the parsed resume directory, which a fresh checkout does not have
+        self._parsed_resume_dir_path.mkdir(parents=True, exist_ok=True)
+
+        # Load the cache mapping resume stems to the key of their last successful parse
+        cache_path = self._parsed_resume_dir_path / ".cache.json"
+        cache = (self._jsoner.read_json(cache_path) if cache_path.is_file() else None) or {}
+
+        # Build one chat completion request per resume that needs parsing, identified by its file path
+        file_paths_and_cache_keys, duplicate_file_paths = {}, {}
+        batch_requests = b"".join(
+            orjson.dumps({
+                "custom_id": file_path,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_chat_completion_body(self._build_resume_message(Path(file_path).stem, file_content), system_prompt)
+            }) + b"\n"
+            for file_path, file_content in self._iter_unique_resumes(self._iter_uncached_resumes(FileReader(["../docx", "../pdf"], max_workers=self._max_workers, max_processes=self._max_processes).iter_file_contents(), system_prompt, cache, file_paths_and_cache_keys), file_paths_and_cache_keys, duplicate_file_paths)
+        )
+
+        if batch_id is not None:
+            # Resume a batch created by an earlier run
+            batch = await _retry_openai_request(self._client.batches.retrieve)(batch_id)
+            logger.info("Resumed batch %s, which is %s", batch.id, batch.status)
+        elif not batch_requests:
+            logger.info("No resumes to parse.")
+            return
+        else:
+            # Upload the requests and create the batch
+            input_file = await _retry_openai_request(self._client.files.create)(file=("requests.jsonl", batch_requests), purpose="batch")
+            batch = await _retry_openai_request(self._client.batches.create)(input_file_id=input_file.id, endpoint="/v1/chat/completions", completion_window="24h")
+            logger.info("Created batch %s with %s resumes; pass batch_id=%s to resume it if this run fails", batch.id, batch_requests.count(b"\n"), batch.id)
+
+        # Poll the batch until it ends
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            batch = await _retry_openai_request(self._client.batches.retrieve)(batch.id)
+            logger.info("Batch %s is %s", batch.id, batch.status)
+
+        if batch.error_file_id is not None:
+            logger.error("Batch %s has failed requests in error file %s", batch.id, batch.error_file_id)
+
+        if batch.output_file_id is None:
+            logger.error("Batch %s ended as %s without output", batch.id, batch.status)
+            return
+
+        # Write the result of each request back to its resume
+        output_file = await _retry_openai_request(self._client.files.content)(batch.output_file_id)
+        for line in output_file.content.splitlines():
+            if not line.strip():
+                continue
+
+            result = orjson.loads(line)
+            file_path = result["custom_id"]
+            owner = Path(file_path).stem
+
+            # A resumed batch may hold resumes that have changed or been parsed since it was created
+            if file_path not in file_paths_and_cache_keys:
+                logger.info("Skipping %s, which no longer needs this parse", file_path)
+                continue
+
+            try:
+                if result.get("error") is not None or result["response"]["status_code"] != 200:
+                    raise ValueError(result.get("error") or result["response"]["body"])
+
+                choice = result["response"]["body"]["choices"][0]
+                parsed_content = await self._validate_parsed_resume(orjson.loads(choice["message"]["content"]), system_prompt)
+            except Exception as e:
+                logger.error("Failed to parse %s: %s", file_path, e)
+                continue
+
+            written = await asyncio.to_thread(self._jsoner.write_json, self._parsed_resume_dir_path / f"{owner}.json", parsed_content)
+            logger.info("Parsed  %s, Finish Reason: %s", file_path, choice["finish_reason"])
+
+            for same_file_path, same_written in [(file_path, written), *await self._save_duplicate_resumes(file_path, parsed_content, duplicate_file_paths)]:
+                # Copy the content so that each MongoDB document gets its own _id
+                parsed_contents.append(dict(parsed_content))
+
+                # A cache hit relies on the JSON file, so only cache resumes whose file was written
+                if same_written:
+                    cache[Path(same_file_path).stem] = file_paths_and_cache_keys[same_file_path]
+
+        self._insert_into_mongo_db(parsed_contents)
+
+        # Record the parses only once they are in MongoDB, so a failed insert is retried by the next run
+        if parsed_contents:
+            self._jsoner.write_json(cache_path, cache)
+
+    def parse_resumes_sync(self):
+        """
+        Run parse_resumes to completion from synchronous code.
+        """
+        asyncio.run(self.parse_resumes())
+
+    def parse_resumes_with_batch_api_sync(self, poll_interval: float = 60, batch_id: Optional[str] = None):
+        """
+        Run parse_resumes_with_batch_api to completion from synchronous code.
+
+        Args:
+            poll_interval (float, optional): The number of seconds between batch status checks (default is 60).
+            batch_id (Optional[str], optional): The ID of a previously created batch to resume (default is None).
+        """
+        asyncio.run(self.parse_resumes_with_batch_api(poll_interval, batch_id))